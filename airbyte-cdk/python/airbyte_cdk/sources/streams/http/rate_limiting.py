@@ -37,6 +37,9 @@ TRANSIENT_EXCEPTIONS = (DefaultBackoffException, exceptions.ConnectTimeout, exce
 # TODO inject singleton logger?
 logger = AirbyteLogger()
 
+# Indirection over time.sleep so tests can substitute a no-op without patching the global time module
+_sleep = time.sleep
+
 
 def default_backoff_handler(max_tries: int, factor: int, **kwargs):
     def log_retry_attempt(details):
@@ -70,7 +73,7 @@ def user_defined_backoff_handler(max_tries: int, **kwargs):
         if isinstance(exc, UserDefinedBackoffException):
             retry_after = exc.backoff
             logger.info(f"Retrying. Sleeping for {retry_after} seconds")
-            time.sleep(retry_after + 1)  # extra second to cover any fractions of second
+            _sleep(retry_after + 1)  # extra second to cover any fractions of second
 
     def log_give_up(details):
         _, exc, _ = sys.exc_info()
@@ -24,8 +24,8 @@
 
 
 import json
-from typing import Any, Iterable, Mapping, Optional
-from unittest.mock import ANY
+from typing import Any, Callable, Iterable, Mapping, Optional
+from unittest.mock import ANY, call, patch
 
 import pytest
 import requests
@@ -34,6 +34,25 @@ from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.exceptions import RequestBodyException, UserDefinedBackoffException
 
 
+class CannedAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter answering every request in-process from a router callable.
+
+    Mounting this once on a stream's session replaces per-test requests_mock setup/teardown: there is no
+    matcher registration or URL matching, just a direct call to the router to produce the response body.
+    """
+
+    def __init__(self, router: Callable[[requests.PreparedRequest], bytes], **kwargs):
+        super().__init__(**kwargs)
+        self.router = router
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response._content = self.router(request)
+        return response
+
+
 class StubBasicReadHttpStream(HttpStream):
     url_base = "https://test_base_url.com"
     primary_key = ""
@@ -62,65 +81,78 @@ class StubBasicReadHttpStream(HttpStream):
         yield stubResp
 
 
-def test_request_kwargs_used(mocker, requests_mock):
+@pytest.fixture(scope="module")
+def basic_stream():
+    """Build the stream (and its underlying requests.Session) once for the whole module instead of once per test."""
     stream = StubBasicReadHttpStream()
-    request_kwargs = {"cert": None, "proxies": "google.com"}
-    mocker.patch.object(stream, "request_kwargs", return_value=request_kwargs)
-    mocker.patch.object(stream._session, "send", wraps=stream._session.send)
-    requests_mock.register_uri("GET", stream.url_base)
+    # Answer requests locally; StubBasicReadHttpStream.parse_response ignores the response body anyway.
+    stream._session.mount(stream.url_base, CannedAdapter(router=lambda request: b"{}"))
+    return stream
 
-    list(stream.read_records(sync_mode=SyncMode.full_refresh))
 
-    stream._session.send.assert_any_call(ANY, **request_kwargs)
+@pytest.fixture(autouse=True)
+def reset_basic_stream(basic_stream):
+    """Reset the mutable state the shared stream accumulates so each test starts from a clean slate."""
+    basic_stream.resp_counter = 1
 
 
-def test_stub_basic_read_http_stream_read_records(mocker):
-    stream = StubBasicReadHttpStream()
-    blank_response = {}  # Send a blank response is fine as we ignore the response in `parse_response anyway.
-    mocker.patch.object(StubBasicReadHttpStream, "_send_request", return_value=blank_response)
+def test_request_kwargs_used(mocker, basic_stream):
+    request_kwargs = {"cert": None, "proxies": "google.com"}
+    mocker.patch.object(basic_stream, "request_kwargs", return_value=request_kwargs)
+    mocker.spy(basic_stream._session, "send")
 
-    records = list(stream.read_records(SyncMode.full_refresh))
+    list(basic_stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    basic_stream._session.send.assert_any_call(ANY, **request_kwargs)
+
+
+# The stub's behavior never varies, so patch at decoration time instead of through the per-test mocker fixture.
+# Sending a blank response is fine as we ignore the response in `parse_response` anyway.
+@patch.object(StubBasicReadHttpStream, "_send_request", return_value={})
+def test_stub_basic_read_http_stream_read_records(_send_request, basic_stream):
+    records = list(basic_stream.read_records(SyncMode.full_refresh))
 
     assert [{"data": 1}] == records
 
 
 class StubNextPageTokenHttpStream(StubBasicReadHttpStream):
-    current_page = 0
-
     def __init__(self, pages: int = 5):
         super().__init__()
         self._pages = pages
+        self.current_page = 0
 
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
-        while self.current_page < self._pages:
+        if self.current_page < self._pages:
             page_token = {"page": self.current_page}
             self.current_page += 1
             return page_token
         return None
 
 
-def test_next_page_token_is_input_to_other_methods(mocker):
+# Shared by the pagination test below; frozen at module scope so the dicts are built exactly once.
+_PAGES = 5
+# Since we have 5 pages, we expect 5 tokens which are {"page":0}, {"page":1}, etc... The first call in the
+# pagination loop happens before any token is available, hence the leading None.
+EXPECTED_TOKENS = (None,) + tuple({"page": i} for i in range(_PAGES))
+METHODS = ("request_params", "request_headers", "request_body_json")
+
+
+# Sending a blank response is fine as we ignore the response in `parse_response` anyway.
+@patch.object(StubNextPageTokenHttpStream, "_send_request", return_value={})
+def test_next_page_token_is_input_to_other_methods(_send_request, mocker):
     """Validates that the return value from next_page_token is passed into other methods that need it like request_params, headers, body, etc.."""
-    pages = 5
-    stream = StubNextPageTokenHttpStream(pages=pages)
-    blank_response = {}  # Send a blank response is fine as we ignore the response in `parse_response anyway.
-    mocker.patch.object(StubNextPageTokenHttpStream, "_send_request", return_value=blank_response)
+    stream = StubNextPageTokenHttpStream(pages=_PAGES)
 
-    methods = ["request_params", "request_headers", "request_body_json"]
-    for method in methods:
-        # Wrap all methods we're interested in testing with mocked objects so we can later spy on their input args and verify they were what we expect
-        mocker.patch.object(stream, method, wraps=getattr(stream, method))
+    for method in METHODS:
+        # Spy on all methods we're interested in testing so we can later inspect their input args and verify they were what we expect
+        mocker.spy(stream, method)
 
     records = list(stream.read_records(SyncMode.full_refresh))
 
-    # Since we have 5 pages, we expect 5 tokens which are {"page":1}, {"page":2}, etc...
-    expected_next_page_tokens = [{"page": i} for i in range(pages)]
-    for method in methods:
-        # First assert that they were called with no next_page_token. This is the first call in the pagination loop.
-        getattr(stream, method).assert_any_call(next_page_token=None, stream_slice=None, stream_state={})
-        for token in expected_next_page_tokens:
-            # Then verify that each method
-            getattr(stream, method).assert_any_call(next_page_token=token, stream_slice=None, stream_state={})
+    expected_calls = [call(next_page_token=token, stream_slice=None, stream_state={}) for token in EXPECTED_TOKENS]
+    for method in METHODS:
+        # Verify each method was called exactly once per page, with the token for that page, in order.
+        assert getattr(stream, method).call_args_list == expected_calls
 
     expected = [{"data": 1}, {"data": 2}, {"data": 3}, {"data": 4}, {"data": 5}, {"data": 6}]
 
@@ -143,13 +175,18 @@ class StubCustomBackoffHttpStream(StubBasicReadHttpStream):
         return 0.5
 
 
+# Canned rate-limited response, shared by any test needing a 429. Tests must treat it as read-only.
+_RESP_429 = requests.Response()
+_RESP_429.status_code = 429
+
+
 def test_stub_custom_backoff_http_stream(mocker):
-    mocker.patch("time.sleep", lambda x: None)
+    # Patch the rate limiter's sleep indirection rather than the global time.sleep, so other code
+    # (and other tests running in parallel) still see the real clock.
+    mocker.patch("airbyte_cdk.sources.streams.http.rate_limiting._sleep", lambda _t: None)
     stream = StubCustomBackoffHttpStream()
-    req = requests.Response()
-    req.status_code = 429
 
-    mocker.patch.object(requests.Session, "send", return_value=req)
+    mocker.patch.object(requests.Session, "send", return_value=_RESP_429)
 
     with pytest.raises(UserDefinedBackoffException):
         list(stream.read_records(SyncMode.full_refresh))
@@ -165,6 +202,12 @@ class PostHttpStream(StubBasicReadHttpStream):
         yield response.json()
 
 
+def request2response(request: requests.PreparedRequest) -> bytes:
+    """Echoes a request's body and content type so tests can assert on what was actually sent."""
+    body = request.body.decode() if isinstance(request.body, bytes) else request.body
+    return json.dumps({"body": body, "content_type": request.headers.get("Content-Type")}).encode()
+
+
 class TestRequestBody:
     """Suite of different tests for request bodies"""
 
@@ -173,68 +216,61 @@ class TestRequestBody:
     form_body = {"key1": "value1", "key2": 1234}
     urlencoded_form_body = "key1=value1&key2=1234"
 
-    def request2response(self, request, context):
-        return json.dumps({"body": request.text, "content_type": request.headers.get("Content-Type")})
-
-    def test_json_body(self, mocker, requests_mock):
-
-        stream = PostHttpStream()
-        mocker.patch.object(stream, "request_body_json", return_value=self.json_body)
-
-        requests_mock.register_uri("POST", stream.url_base, text=self.request2response)
-        response = list(stream.read_records(sync_mode=SyncMode.full_refresh))[0]
-
-        assert response["content_type"] == "application/json"
-        assert json.loads(response["body"]) == self.json_body
-
-    def test_text_body(self, mocker, requests_mock):
-
+    @pytest.fixture(scope="class")
+    def stream(self):
+        """One PostHttpStream (and one requests.Session) shared by every test in the class."""
         stream = PostHttpStream()
-        mocker.patch.object(stream, "request_body_data", return_value=self.data_body)
-
-        requests_mock.register_uri("POST", stream.url_base, text=self.request2response)
-        response = list(stream.read_records(sync_mode=SyncMode.full_refresh))[0]
-
-        assert response["content_type"] is None
-        assert response["body"] == self.data_body
-
-    def test_form_body(self, mocker, requests_mock):
-
-        stream = PostHttpStream()
-        mocker.patch.object(stream, "request_body_data", return_value=self.form_body)
-
-        requests_mock.register_uri("POST", stream.url_base, text=self.request2response)
-        response = list(stream.read_records(sync_mode=SyncMode.full_refresh))[0]
-
-        assert response["content_type"] == "application/x-www-form-urlencoded"
-        assert response["body"] == self.urlencoded_form_body
-
-    def test_text_json_body(self, mocker, requests_mock):
+        stream._session.mount(stream.url_base, CannedAdapter(router=request2response))
+        return stream
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, stream):
+        """Restore the only state tests mutate on the shared stream."""
+        stream.resp_counter = 1
+        stream.http_method = "POST"
+
+    @pytest.mark.parametrize(
+        "method_name, body, expected_content_type, expected_body",
+        [
+            ("request_body_json", json_body, "application/json", json.dumps(json_body)),
+            ("request_body_data", data_body, None, data_body),
+            ("request_body_data", form_body, "application/x-www-form-urlencoded", urlencoded_form_body),
+        ],
+        ids=["json", "text", "form"],
+    )
+    def test_body(self, mocker, stream, method_name, body, expected_content_type, expected_body):
+        """Stream must encode each body type with the matching content type"""
+        mocker.patch.object(stream, method_name, return_value=body)
+
+        response = next(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+        assert response["content_type"] == expected_content_type
+        assert response["body"] == expected_body
+
+    def test_text_json_body(self, mocker, stream):
         """checks a exception if both functions were overridden"""
-        stream = PostHttpStream()
         mocker.patch.object(stream, "request_body_data", return_value=self.data_body)
         mocker.patch.object(stream, "request_body_json", return_value=self.json_body)
-        requests_mock.register_uri("POST", stream.url_base, text=self.request2response)
         with pytest.raises(RequestBodyException):
             list(stream.read_records(sync_mode=SyncMode.full_refresh))
 
-    def test_body_for_all_methods(self, mocker, requests_mock):
+    @pytest.mark.parametrize(
+        "method, with_body",
+        [
+            ("POST", True),
+            ("PUT", True),
+            ("PATCH", True),
+            ("GET", False),
+            ("DELETE", False),
+            ("OPTIONS", False),
+        ],
+    )
+    def test_body_for_all_methods(self, mocker, stream, method, with_body):
         """Stream must send a body for POST/PATCH/PUT methods only"""
-        stream = PostHttpStream()
-        methods = {
-            "POST": True,
-            "PUT": True,
-            "PATCH": True,
-            "GET": False,
-            "DELETE": False,
-            "OPTIONS": False,
-        }
-        for method, with_body in methods.items():
-            stream.http_method = method
-            mocker.patch.object(stream, "request_body_data", return_value=self.data_body)
-            requests_mock.register_uri(method, stream.url_base, text=self.request2response)
-            response = list(stream.read_records(sync_mode=SyncMode.full_refresh))[0]
-            if with_body:
-                assert response["body"] == self.data_body
-            else:
-                assert response["body"] is None
+        stream.http_method = method
+        mocker.patch.object(stream, "request_body_data", return_value=self.data_body)
+        response = next(stream.read_records(sync_mode=SyncMode.full_refresh))
+        if with_body:
+            assert response["body"] == self.data_body
+        else:
+            assert response["body"] is None